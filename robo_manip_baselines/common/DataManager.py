@@ -1,5 +1,6 @@
 import os
 import warnings
+import concurrent.futures
 import numpy as np
 import cv2
 from enum import Enum
@@ -134,29 +135,56 @@ class DataManager(object):
         data_seq = self.all_data_seq[key]
         if "rgb_image" in key:
             if data_seq[0].ndim == 1:
-                data_seq = np.array(
-                    [cv2.imdecode(data, flags=cv2.IMREAD_COLOR) for data in data_seq]
-                )
+                data_seq = self._decode_data_seq(data_seq, cv2.IMREAD_COLOR)
         elif ("depth_image" in key) and ("fov" not in key):
             if data_seq[0].ndim == 1:
-                data_seq = np.array(
-                    [
-                        cv2.imdecode(data, flags=cv2.IMREAD_UNCHANGED)
-                        for data in data_seq
-                    ]
-                )
+                data_seq = self._decode_data_seq(data_seq, cv2.IMREAD_UNCHANGED)
         return data_seq
 
+    def _decode_data_seq(self, data_seq, imread_flags):
+        """Decode an encoded image sequence into a preallocated array."""
+        first_data = cv2.imdecode(data_seq[0], flags=imread_flags)
+        decoded_seq = np.empty(
+            (len(data_seq),) + first_data.shape, dtype=first_data.dtype
+        )
+        decoded_seq[0] = first_data
+
+        def decode_single_data(time_idx):
+            decoded_seq[time_idx] = cv2.imdecode(data_seq[time_idx], flags=imread_flags)
+
+        # cv2.imdecode releases the GIL, so frames can be decoded in parallel
+        # threads directly into the preallocated array
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            list(executor.map(decode_single_data, range(1, len(data_seq))))
+        return decoded_seq
+
     def compress_data(self, key, compress_flag):
         """Compress data."""
         key = DataKey.replace_deprecated_key(key)  # For backward compatibility
-        for time_idx, data in enumerate(self.all_data_seq[key]):
+
+        def encode_single_data(data):
             if compress_flag == "jpg":
-                self.all_data_seq[key][time_idx] = cv2.imencode(
-                    ".jpg", data, (cv2.IMWRITE_JPEG_QUALITY, 95)
-                )[1]
+                return cv2.imencode(".jpg", data, (cv2.IMWRITE_JPEG_QUALITY, 95))[1]
             elif compress_flag == "exr":
-                self.all_data_seq[key][time_idx] = cv2.imencode(".exr", data)[1]
+                # OpenCV only encodes single-precision input; store half
+                # precision in the file to match the recorded precision
+                if data.dtype == np.float16:
+                    data = data.astype(np.float32)
+                return cv2.imencode(
+                    ".exr", data, (cv2.IMWRITE_EXR_TYPE, cv2.IMWRITE_EXR_TYPE_HALF)
+                )[1]
+            else:
+                return data
+
+        # cv2.imencode releases the GIL, so frames can be encoded in parallel threads
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            self.all_data_seq[key] = list(
+                executor.map(encode_single_data, self.all_data_seq[key])
+            )
 
     def save_data(self, filename):
         """Save data."""
@@ -166,25 +194,30 @@ class DataManager(object):
             if orig_key != new_key:
                 self.all_data_seq[new_key] = self.all_data_seq.pop(orig_key)
 
-        # If each element has a different shape, save it as an object array
+        # Pack each sequence into a contiguous array; only if each element has a
+        # different shape, fall back to an object array (pickled per element)
         for key in self.all_data_seq.keys():
-            if (
-                isinstance(self.all_data_seq[key], list)
-                and len(
-                    {
-                        data.shape if isinstance(data, np.ndarray) else None
-                        for data in self.all_data_seq[key]
-                    }
-                )
-                > 1
-            ):
-                self.all_data_seq[key] = np.array(self.all_data_seq[key], dtype=object)
+            if isinstance(self.all_data_seq[key], list):
+                if (
+                    len(
+                        {
+                            data.shape if isinstance(data, np.ndarray) else None
+                            for data in self.all_data_seq[key]
+                        }
+                    )
+                    > 1
+                ):
+                    self.all_data_seq[key] = np.array(
+                        self.all_data_seq[key], dtype=object
+                    )
+                else:
+                    self.all_data_seq[key] = np.stack(self.all_data_seq[key])
 
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         self.all_data_seq.update(self.general_info)
         self.all_data_seq.update(self.world_info)
         self.all_data_seq.update(self.camera_info)
-        np.savez(
+        np.savez_compressed(
             filename,
             **self.all_data_seq,
         )
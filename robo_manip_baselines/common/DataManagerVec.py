@@ -1,4 +1,5 @@
 import os
+import concurrent.futures
 import numpy as np
 import cv2
 from .DataManager import MotionStatus, DataKey, DataManager
@@ -7,23 +8,53 @@ from .DataManager import MotionStatus, DataKey, DataManager
 class DataManagerVec(DataManager):
     """Data manager with vectorization."""
 
+    INITIAL_BUF_CAPACITY = 128
+
     def reset(self):
         """Reset."""
         self.status = MotionStatus(0)
 
         self.all_data_seq_list = [{} for env_idx in range(self.env.unwrapped.num_envs)]
 
+        # Fixed-shape numeric data is stored in preallocated (capacity, num_envs,
+        # ...) buffers grown by doubling, so that the per-env sequences can be
+        # sliced out at save time without stacking Python lists. Image data stays
+        # in per-env lists since the frames are replaced by variable-length
+        # encoded arrays at compression time.
+        self.numeric_data_buf = {}
+        self.numeric_data_len = {}
+
     def append_single_data(self, key, data_list):
         """Append a single data to the data sequence."""
         key = DataKey.replace_deprecated_key(key)  # For backward compatibility
-        for all_data_seq, data in zip(self.all_data_seq_list, data_list):
-            if key not in all_data_seq:
-                all_data_seq[key] = []
-            all_data_seq[key].append(data)
+        if ("rgb_image" in key) or ("depth_image" in key):
+            for all_data_seq, data in zip(self.all_data_seq_list, data_list):
+                if key not in all_data_seq:
+                    all_data_seq[key] = []
+                all_data_seq[key].append(data)
+            return
+        data_arr = np.asarray(data_list)
+        buf = self.numeric_data_buf.get(key)
+        if buf is None:
+            buf = np.empty(
+                (self.INITIAL_BUF_CAPACITY,) + data_arr.shape, dtype=data_arr.dtype
+            )
+            self.numeric_data_buf[key] = buf
+            self.numeric_data_len[key] = 0
+        data_len = self.numeric_data_len[key]
+        if data_len == buf.shape[0]:
+            new_buf = np.empty((2 * buf.shape[0],) + buf.shape[1:], dtype=buf.dtype)
+            new_buf[:data_len] = buf
+            buf = new_buf
+            self.numeric_data_buf[key] = buf
+        buf[data_len] = data_arr
+        self.numeric_data_len[key] = data_len + 1
 
     def get_single_data(self, key, time_idx):
         """Get a single data from the data sequence."""
         key = DataKey.replace_deprecated_key(key)  # For backward compatibility
+        if key in self.numeric_data_buf:
+            return list(self.numeric_data_buf[key][time_idx])
         data_list = []
         for all_data_seq in self.all_data_seq_list:
             data = all_data_seq[key][time_idx]
@@ -39,41 +70,57 @@ class DataManagerVec(DataManager):
     def get_data(self, key):
         """Get a data sequence."""
         key = DataKey.replace_deprecated_key(key)  # For backward compatibility
+        if key in self.numeric_data_buf:
+            data_len = self.numeric_data_len[key]
+            return [
+                self.numeric_data_buf[key][:data_len, env_idx]
+                for env_idx in range(len(self.all_data_seq_list))
+            ]
         data_seq_list = []
         for all_data_seq in self.all_data_seq_list:
             data_seq = all_data_seq[key]
             if "rgb_image" in key:
                 if data_seq[0].ndim == 1:
-                    data_seq = np.array(
-                        [
-                            cv2.imdecode(data, flags=cv2.IMREAD_COLOR)
-                            for data in data_seq
-                        ]
-                    )
+                    data_seq = self._decode_data_seq(data_seq, cv2.IMREAD_COLOR)
             elif ("depth_image" in key) and ("fov" not in key):
                 if data_seq[0].ndim == 1:
-                    data_seq = np.array(
-                        [
-                            cv2.imdecode(data, flags=cv2.IMREAD_UNCHANGED)
-                            for data in data_seq
-                        ]
-                    )
+                    data_seq = self._decode_data_seq(data_seq, cv2.IMREAD_UNCHANGED)
             data_seq_list.append(data_seq)
         return data_seq_list
 
     def compress_data(self, key, compress_flag, filter_list=None):
         """Compress data."""
         key = DataKey.replace_deprecated_key(key)  # For backward compatibility
-        for data_idx, all_data_seq in enumerate(self.all_data_seq_list):
-            if (filter_list is not None) and (not filter_list[data_idx]):
-                continue
-            for time_idx, data in enumerate(all_data_seq[key]):
-                if compress_flag == "jpg":
-                    all_data_seq[key][time_idx] = cv2.imencode(
-                        ".jpg", data, (cv2.IMWRITE_JPEG_QUALITY, 95)
-                    )[1]
-                elif compress_flag == "exr":
-                    all_data_seq[key][time_idx] = cv2.imencode(".exr", data)[1]
+
+        def encode_single_data(task):
+            data_seq, time_idx = task
+            if compress_flag == "jpg":
+                data_seq[time_idx] = cv2.imencode(
+                    ".jpg", data_seq[time_idx], (cv2.IMWRITE_JPEG_QUALITY, 95)
+                )[1]
+            elif compress_flag == "exr":
+                data = data_seq[time_idx]
+                # OpenCV only encodes single-precision input; store half
+                # precision in the file to match the recorded precision
+                if data.dtype == np.float16:
+                    data = data.astype(np.float32)
+                data_seq[time_idx] = cv2.imencode(
+                    ".exr", data, (cv2.IMWRITE_EXR_TYPE, cv2.IMWRITE_EXR_TYPE_HALF)
+                )[1]
+
+        task_list = [
+            (all_data_seq[key], time_idx)
+            for data_idx, all_data_seq in enumerate(self.all_data_seq_list)
+            if (filter_list is None) or filter_list[data_idx]
+            for time_idx in range(len(all_data_seq[key]))
+        ]
+
+        # cv2.imencode releases the GIL, so the frames of all envs can be
+        # encoded in parallel threads
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            list(executor.map(encode_single_data, task_list))
 
     def save_data(self, filename_list):
         """Save data."""
@@ -99,23 +146,45 @@ class DataManagerVec(DataManager):
                 ):
                     all_data_seq[key] = np.array(all_data_seq[key], dtype=object)
 
-        for all_data_seq, filename in zip(self.all_data_seq_list, filename_list):
-            if filename is None:
-                continue
+        def save_single_data(task):
+            env_idx, all_data_seq, filename = task
+            # Slice the per-env sequence out of the preallocated buffers
+            numeric_data_seq = {
+                key: buf[: self.numeric_data_len[key], env_idx]
+                for key, buf in self.numeric_data_buf.items()
+            }
             os.makedirs(os.path.dirname(filename), exist_ok=True)
             np.savez(
                 filename,
                 **all_data_seq,
+                **numeric_data_seq,
                 **self.general_info,
                 **self.world_info,
                 **self.camera_info,
             )
 
+        task_list = [
+            (env_idx, all_data_seq, filename)
+            for env_idx, (all_data_seq, filename) in enumerate(
+                zip(self.all_data_seq_list, filename_list)
+            )
+            if filename is not None
+        ]
+
+        # The file I/O releases the GIL, so the per-env episodes can be written
+        # in parallel threads
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            list(executor.map(save_single_data, task_list))
+
         self.data_idx += 1
 
     def load_data(self, filename_list):
         """Load data."""
         self.all_data_seq_list = [{} for file_idx in range(len(filename_list))]
+        self.numeric_data_buf = {}
+        self.numeric_data_len = {}
         for all_data_seq, filename in zip(self.all_data_seq_list, filename_list):
             npz_data = np.load(filename, allow_pickle=True)
             for orig_key in npz_data.keys():
@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.linalg
 import pinocchio as pin
 
 
@@ -40,6 +41,13 @@ class MotionManager(object):
             self.env.unwrapped.gripper_action_idx
         ]
 
+        # Preallocated buffers reused by inverse_kinematics every control step
+        self._ik_jacobian = np.empty((6, self.pin_model.nv))
+        self._ik_damped_mat = np.empty((6, 6))
+
+        # Preallocated buffer reused by set_relative_target_se3 every control step
+        self._target_rot = np.empty((3, 3))
+
     def reset(self):
         """Reset states of arm and gripper."""
         self.joint_pos = self.env.unwrapped.init_qpos[
@@ -61,13 +69,22 @@ class MotionManager(object):
             self.joint_pos,
             self.env.unwrapped.ik_eef_joint_id,
         )  # in joint frame
-        J = -1 * np.dot(pin.Jlog6(error_se3.inverse()), J)
+        np.matmul(pin.Jlog6(error_se3.inverse()), J, out=self._ik_jacobian)
+        J = self._ik_jacobian
+        J *= -1
         damping_scale = 1e-6
+        damped_mat = np.matmul(J, J.T, out=self._ik_damped_mat)
+        damped_mat.flat[::7] += np.dot(error_vec, error_vec) + damping_scale
+        # The damped matrix is symmetric positive definite, so solve via Cholesky
+        # factorization; check_finite=False skips the LAPACK input validation,
+        # which dominates the cost of such a small (6x6) solve
         delta_joint_pos = -1 * J.T.dot(
-            np.linalg.solve(
-                J.dot(J.T)
-                + (np.dot(error_vec, error_vec) + damping_scale) * np.identity(6),
+            scipy.linalg.cho_solve(
+                scipy.linalg.cho_factor(
+                    damped_mat, overwrite_a=True, check_finite=False
+                ),
                 error_vec,
+                check_finite=False,
             )
         )
         self.joint_pos = pin.integrate(self.pin_model, self.joint_pos, delta_joint_pos)
@@ -78,9 +95,12 @@ class MotionManager(object):
         if delta_pos is not None:
             self.target_se3.translation += delta_pos
         if delta_rpy is not None:
-            self.target_se3.rotation = np.matmul(
-                pin.rpy.rpyToMatrix(*delta_rpy), self.target_se3.rotation
+            np.matmul(
+                pin.rpy.rpyToMatrix(*delta_rpy),
+                self.target_se3.rotation,
+                out=self._target_rot,
             )
+            self.target_se3.rotation = self._target_rot
 
     def draw_markers(self):
         """Draw markers of the current and target poses of the end-effector to viewer."""
@@ -127,6 +147,42 @@ class MotionManager(object):
             ]
         )
 
+    def get_joint_pos_list(self, obs_list):
+        """Get joint positions from a list of observations as a single 2D array."""
+        return self.env.unwrapped.get_joint_pos_from_obs_list(
+            obs_list, exclude_gripper=False
+        )
+
+    def get_joint_vel_list(self, obs_list):
+        """Get joint velocities from a list of observations as a single 2D array."""
+        return self.env.unwrapped.get_joint_vel_from_obs_list(
+            obs_list, exclude_gripper=False
+        )
+
+    def get_eef_wrench_list(self, obs_list):
+        """Get end-effector wrenches from a list of observations as a single 2D array."""
+        return self.env.unwrapped.get_eef_wrench_from_obs_list(obs_list)
+
+    def get_measured_eef_seq(self, obs_seq):
+        """Get measured end-effector poses (tx, ty, tz, qw, qx, qy, qz) from a sequence of observations.
+
+        Running forward kinematics over the whole sequence at once writes into a
+        single preallocated (T, 7) array instead of concatenating per step.
+        """
+        measured_eef_seq = np.empty((len(obs_seq), 7))
+        ik_eef_joint_id = self.env.unwrapped.ik_eef_joint_id
+        for time_idx, obs in enumerate(obs_seq):
+            measured_joint_pos = self.env.unwrapped.get_joint_pos_from_obs(
+                obs, exclude_gripper=True
+            )
+            pin.forwardKinematics(self.pin_model, self.pin_data_obs, measured_joint_pos)
+            measured_se3 = self.pin_data_obs.oMi[ik_eef_joint_id]
+            measured_eef_seq[time_idx, 0:3] = measured_se3.translation
+            measured_eef_seq[time_idx, 3:7] = pin.Quaternion(
+                measured_se3.rotation
+            ).coeffs()[[3, 0, 1, 2]]
+        return measured_eef_seq
+
     def get_command_eef(self):
         """Get command end-effector pose (tx, ty, tz, qw, qx, qy, qz)."""
         return np.concatenate(
@@ -1,45 +1,80 @@
+import functools
 import numpy as np
+import numba
 import cv2
 
 
-def convertDepthImageToColorImage(image):
-    """Convert depth image (float type) to color image (uint8 type)."""
+def convertDepthImageToColorImage(image, dst=None):
+    """Convert depth image (float type) to color image (uint8 type).
+
+    If dst is given, the result is written into it (a preallocated uint8 array
+    of shape image.shape + (3,)) instead of a newly allocated array.
+    """
     eps = 1e-6
     image_copied = image.copy()
-    image_copied[np.logical_not(np.isfinite(image_copied))] = image_copied[
-        np.isfinite(image_copied)
-    ].max()
-    image_copied = (
-        255
-        * (
-            (image_copied - image_copied.min())
-            / (image_copied.max() - image_copied.min() + eps)
-        )
-    ).astype(np.uint8)
-    return cv2.merge((image_copied,) * 3)
+    finite_mask = np.isfinite(image_copied)
+    image_copied[np.logical_not(finite_mask)] = image_copied[finite_mask].max()
+    # Normalize in place to avoid intermediate arrays
+    image_min = image_copied.min()
+    image_max = image_copied.max()
+    image_copied -= image_min
+    image_copied *= 255 / (image_max - image_min + eps)
+    image_copied = image_copied.astype(np.uint8)
+    if dst is None:
+        return cv2.merge((image_copied,) * 3)
+    else:
+        cv2.merge((image_copied,) * 3, dst)
+        return dst
+
+
+@functools.lru_cache(maxsize=8)
+def _getNormalizedPixelGrid(image_height, image_width, fovy):
+    """Get the flat pixel grids (i - H/2) / focal and (j - W/2) / focal.
+
+    The grids depend only on the image shape and field-of-view, which are
+    constant across a rollout, so they are cached across calls.
+    """
+    # A Python float keeps the grid arithmetic below in float32
+    focal_scaling = float(1.0 / np.tan(np.deg2rad(fovy) / 2.0)) * image_height / 2.0
+    ii, jj = np.meshgrid(
+        np.arange(image_height, dtype=np.float32),
+        np.arange(image_width, dtype=np.float32),
+        indexing="ij",
+    )
+    ii_normalized = np.ascontiguousarray(
+        ((ii - 0.5 * image_height) / focal_scaling).ravel()
+    )
+    jj_normalized = np.ascontiguousarray(
+        ((jj - 0.5 * image_width) / focal_scaling).ravel()
+    )
+    return ii_normalized, jj_normalized
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _convertDepthImageToXyzArray(depth_flat, ii_normalized, jj_normalized, xyz_array):
+    """Fill a preallocated (H*W, 3) array with 3D positions in a single fused pass."""
+    for flat_idx in numba.prange(depth_flat.shape[0]):
+        depth = depth_flat[flat_idx]
+        xyz_array[flat_idx, 0] = jj_normalized[flat_idx] * depth
+        xyz_array[flat_idx, 1] = ii_normalized[flat_idx] * depth
+        xyz_array[flat_idx, 2] = depth
 
 
 def convertDepthImageToPointCloud(depth_image, fovy, rgb_image=None, dist_thre=None):
     """Convert depth image (float type) to point cloud (array of 3D position)."""
-    focal_scaling = (1.0 / np.tan(np.deg2rad(fovy) / 2.0)) * depth_image.shape[0] / 2.0
-    xyz_array = np.array(
-        [
-            (i, j)
-            for i in range(depth_image.shape[0])
-            for j in range(depth_image.shape[1])
-        ],
-        dtype=np.float32,
+    ii_normalized, jj_normalized = _getNormalizedPixelGrid(
+        depth_image.shape[0], depth_image.shape[1], float(fovy)
     )
-    xyz_array = (
-        xyz_array - 0.5 * np.array(depth_image.shape[:2], dtype=np.float32)
-    ) / focal_scaling
-    xyz_array *= depth_image.flatten()[:, np.newaxis]
-    xyz_array = np.hstack((xyz_array[:, [1, 0]], depth_image.flatten()[:, np.newaxis]))
+    # Upcast here so that float16 depth images recorded by teleoperation can be
+    # visualized; the numba CPU target does not support float16 arrays
+    depth_flat = np.ascontiguousarray(depth_image.ravel(), dtype=np.float32)
+    xyz_array = np.empty((depth_flat.shape[0], 3), dtype=np.float32)
+    _convertDepthImageToXyzArray(depth_flat, ii_normalized, jj_normalized, xyz_array)
     if dist_thre:
-        dist_thre_indices = np.argwhere(depth_image.flatten() < dist_thre)[:, 0]
-        xyz_array = xyz_array[dist_thre_indices]
+        dist_thre_mask = depth_flat < dist_thre
+        xyz_array = xyz_array[dist_thre_mask]
         if rgb_image is not None:
-            rgb_array = rgb_image.reshape(-1, 3)[dist_thre_indices]
+            rgb_array = rgb_image.reshape(-1, 3)[dist_thre_mask]
     if rgb_image is None:
         return xyz_array
     else:
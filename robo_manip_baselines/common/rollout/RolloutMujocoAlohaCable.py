@@ -4,6 +4,11 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientations are constant per status, so build the rotation matrices
+# once at import
+PRE_REACH_ROT = pin.rpy.rpyToMatrix(0.0, np.deg2rad(30), -np.pi / 2)
+REACH_ROT = pin.rpy.rpyToMatrix(0.0, np.deg2rad(60), -np.pi / 2)
+
 
 class RolloutMujocoAlohaCable(RolloutBase):
     def setup_env(self):
@@ -17,13 +22,11 @@ class RolloutMujocoAlohaCable(RolloutBase):
             target_pos[1] += 0.05  # [m]
             if self.data_manager.status == MotionStatus.PRE_REACH:
                 target_pos[2] = 0.3  # [m]
-                target_rpy = np.array([0.0, np.deg2rad(30), -np.pi / 2])
+                target_rot = PRE_REACH_ROT
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos[2] = 0.2  # [m]
-                target_rpy = np.array([0.0, np.deg2rad(60), -np.pi / 2])
-            self.motion_manager.target_se3 = pin.SE3(
-                pin.rpy.rpyToMatrix(*target_rpy), target_pos
-            )
+                target_rot = REACH_ROT
+            self.motion_manager.target_se3 = pin.SE3(target_rot, target_pos)
             self.motion_manager.inverse_kinematics()
         else:
             super().set_arm_command()
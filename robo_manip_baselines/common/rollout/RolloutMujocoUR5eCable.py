@@ -4,6 +4,9 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientation is constant, so build the rotation matrix once at import
+GRASP_ROT = np.diag([-1.0, 1.0, -1.0])
+
 
 class RolloutMujocoUR5eCable(RolloutBase):
     def setup_env(self):
@@ -18,9 +21,7 @@ class RolloutMujocoUR5eCable(RolloutBase):
                 target_pos[2] = 1.02  # [m]
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos[2] = 0.995  # [m]
-            self.motion_manager.target_se3 = pin.SE3(
-                np.diag([-1.0, 1.0, -1.0]), target_pos
-            )
+            self.motion_manager.target_se3 = pin.SE3(GRASP_ROT, target_pos)
             self.motion_manager.inverse_kinematics()
         else:
             super().set_arm_command()
@@ -4,6 +4,14 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientation and per-status offsets are constant, so build them once
+# at import
+GRASP_ROT = pin.rpy.rpyToMatrix(np.pi / 2, 0.0, 0.25 * np.pi)
+PRE_REACH_DELTA_SE3 = pin.SE3(
+    pin.rpy.rpyToMatrix(0.0, 0.125 * np.pi, 0.0), np.array([0.0, -0.2, -0.4])
+)
+REACH_DELTA_SE3 = pin.SE3(np.identity(3), np.array([0.0, -0.2, -0.3]))
+
 
 class RolloutMujocoUR5eCloth(RolloutBase):
     def setup_env(self):
@@ -14,16 +22,12 @@ class RolloutMujocoUR5eCloth(RolloutBase):
     def set_arm_command(self):
         if self.data_manager.status in (MotionStatus.PRE_REACH, MotionStatus.REACH):
             target_se3 = pin.SE3(
-                pin.rpy.rpyToMatrix(np.pi / 2, 0.0, 0.25 * np.pi),
-                self.env.unwrapped.get_body_pose("board")[0:3],
+                GRASP_ROT, self.env.unwrapped.get_body_pose("board")[0:3]
             )
             if self.data_manager.status == MotionStatus.PRE_REACH:
-                target_se3 *= pin.SE3(
-                    pin.rpy.rpyToMatrix(0.0, 0.125 * np.pi, 0.0),
-                    np.array([0.0, -0.2, -0.4]),
-                )
+                target_se3 *= PRE_REACH_DELTA_SE3
             elif self.data_manager.status == MotionStatus.REACH:
-                target_se3 *= pin.SE3(np.identity(3), np.array([0.0, -0.2, -0.3]))
+                target_se3 *= REACH_DELTA_SE3
             self.motion_manager.target_se3 = target_se3
             self.motion_manager.inverse_kinematics()
         else:
@@ -4,6 +4,9 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientation is constant, so build the rotation matrix once at import
+GRASP_ROT = pin.rpy.rpyToMatrix(np.pi / 2, 0.0, np.pi / 2)
+
 
 class RolloutMujocoUR5eRing(RolloutBase):
     def setup_env(self):
@@ -21,9 +24,7 @@ class RolloutMujocoUR5eRing(RolloutBase):
                 target_pos += np.array([-0.15, 0.05, -0.05])  # [m]
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos += np.array([-0.1, 0.05, -0.05])  # [m]
-            self.motion_manager.target_se3 = pin.SE3(
-                pin.rpy.rpyToMatrix(np.pi / 2, 0.0, np.pi / 2), target_pos
-            )
+            self.motion_manager.target_se3 = pin.SE3(GRASP_ROT, target_pos)
             self.motion_manager.inverse_kinematics()
         else:
             super().set_arm_command()
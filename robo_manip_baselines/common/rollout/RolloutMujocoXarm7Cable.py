@@ -4,6 +4,9 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientation is constant, so build the rotation matrix once at import
+GRASP_ROT = pin.rpy.rpyToMatrix(np.pi, 0.0, -np.pi / 2)
+
 
 class RolloutMujocoXarm7Cable(RolloutBase):
     def setup_env(self):
@@ -18,9 +21,7 @@ class RolloutMujocoXarm7Cable(RolloutBase):
                 target_pos[2] = 1.0  # [m]
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos[2] = 0.925  # [m]
-            self.motion_manager.target_se3 = pin.SE3(
-                pin.rpy.rpyToMatrix(np.pi, 0.0, -np.pi / 2), target_pos
-            )
+            self.motion_manager.target_se3 = pin.SE3(GRASP_ROT, target_pos)
             self.motion_manager.inverse_kinematics()
         else:
             super().set_arm_command()
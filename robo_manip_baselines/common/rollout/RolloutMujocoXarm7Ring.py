@@ -4,6 +4,9 @@ import gymnasium as gym
 from robo_manip_baselines.common import MotionStatus
 from .RolloutBase import RolloutBase
 
+# Grasp orientation is constant, so build the rotation matrix once at import
+GRASP_ROT = pin.rpy.rpyToMatrix(0.0, 1.5 * np.pi, np.pi)
+
 
 class RolloutMujocoXarm7Ring(RolloutBase):
     def setup_env(self):
@@ -21,9 +24,7 @@ class RolloutMujocoXarm7Ring(RolloutBase):
                 target_pos += np.array([-0.2, 0.05, -0.05])  # [m]
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos += np.array([-0.15, 0.05, -0.05])  # [m]
-            self.motion_manager.target_se3 = pin.SE3(
-                pin.rpy.rpyToMatrix(0.0, 1.5 * np.pi, np.pi), target_pos
-            )
+            self.motion_manager.target_se3 = pin.SE3(GRASP_ROT, target_pos)
             self.motion_manager.inverse_kinematics()
         else:
             super().set_arm_command()
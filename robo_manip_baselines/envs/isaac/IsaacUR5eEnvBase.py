@@ -74,10 +74,9 @@ class IsaacUR5eEnvBase(gym.Env, metaclass=ABCMeta):
         self.action_fluctuation_scale = np.array(
             [np.deg2rad(0.1)] * 6 + [0.0], dtype=np.float32
         )
-        self.action_fluctuation_list = [
-            np.zeros(self.action_space.shape, dtype=np.float32)
-            for env_idx in range(self.num_envs)
-        ]
+        self.action_fluctuation_list = np.zeros(
+            (self.num_envs,) + self.action_space.shape, dtype=np.float32
+        )
 
         # Setup internal variables
         self.quit_flag = False
@@ -431,9 +430,11 @@ class IsaacUR5eEnvBase(gym.Env, metaclass=ABCMeta):
                     self.sim, env, camera_handle, gymapi.IMAGE_COLOR
                 )
                 rgb_image = rgb_image.reshape(rgb_image.shape[0], -1, 4)[:, :, :3]
-                depth_image = -1 * self.gym.get_camera_image(
+                depth_image = self.gym.get_camera_image(
                     self.sim, env, camera_handle, gymapi.IMAGE_DEPTH
                 )
+                # Negate in place instead of allocating a temporary array
+                np.negative(depth_image, out=depth_image)
                 info["rgb_images"][camera_name] = rgb_image
                 info["depth_images"][camera_name] = depth_image
             info_list.append(info)
@@ -475,6 +476,26 @@ class IsaacUR5eEnvBase(gym.Env, metaclass=ABCMeta):
         """Get end-effector wrench (fx, fy, fz, nx, ny, nz) from observation."""
         return obs["wrench"]
 
+    def get_joint_pos_from_obs_list(self, obs_list, exclude_gripper=False):
+        """Get joint positions from a list of observations as a single 2D array."""
+        joint_pos_list = np.stack([obs["joint_pos"] for obs in obs_list])
+        if exclude_gripper:
+            return joint_pos_list[:, self.arm_action_idxes]
+        else:
+            return joint_pos_list
+
+    def get_joint_vel_from_obs_list(self, obs_list, exclude_gripper=False):
+        """Get joint velocities from a list of observations as a single 2D array."""
+        joint_vel_list = np.stack([obs["joint_vel"] for obs in obs_list])
+        if exclude_gripper:
+            return joint_vel_list[:, self.arm_action_idxes]
+        else:
+            return joint_vel_list
+
+    def get_eef_wrench_from_obs_list(self, obs_list):
+        """Get end-effector wrenches from a list of observations as a single 2D array."""
+        return np.stack([obs["wrench"] for obs in obs_list])
+
     def get_sim_time(self):
         """Get simulation time. [s]"""
         return self.gym.get_sim_time(self.sim)
@@ -554,12 +575,17 @@ class IsaacUR5eEnvBase(gym.Env, metaclass=ABCMeta):
         ).mean(keepdims=True)
 
     def get_fluctuated_action_list(self, action, update_fluctuation=True):
-        action_list = []
-        for env_idx in range(self.num_envs):
-            if update_fluctuation and (env_idx != self.rep_env_idx):
-                # Set action fluctuation by random walk
-                self.action_fluctuation_list[env_idx] += np.random.normal(
-                    scale=self.action_fluctuation_scale
-                )
-            action_list.append(action + self.action_fluctuation_list[env_idx])
-        return action_list
+        if not update_fluctuation and not self.action_fluctuation_list.any():
+            # Before teleoperation starts the fluctuations are all zero, so the
+            # same action can be broadcast to all envs without any arithmetic
+            return np.broadcast_to(action, self.action_fluctuation_list.shape)
+        if update_fluctuation:
+            # Set action fluctuation by random walk for all envs at once; the
+            # representative env always stays fluctuation-free
+            fluctuation_step = np.random.normal(
+                scale=self.action_fluctuation_scale,
+                size=self.action_fluctuation_list.shape,
+            )
+            fluctuation_step[self.rep_env_idx] = 0.0
+            self.action_fluctuation_list += fluctuation_step
+        return action + self.action_fluctuation_list
@@ -4,6 +4,9 @@ import pinocchio as pin
 from robo_manip_baselines.teleop import TeleopBase
 from robo_manip_baselines.common import MotionStatus
 
+# Grasp orientation is constant, so build the rotation matrix once at import
+GRASP_ROT = np.diag([-1.0, 1.0, -1.0])
+
 
 class TeleopMujocoUR5eCable(TeleopBase):
     def setup_env(self):
@@ -12,16 +15,20 @@ class TeleopMujocoUR5eCable(TeleopBase):
         )
         self.demo_name = self.args.demo_name or "MujocoUR5eCable"
 
+        # Resolve the named body lookup once and reuse the position buffer;
+        # data.body() scans the model names on every call
+        self._cable_end_body = self.env.unwrapped.data.body("cable_end")
+        self._target_pos = np.empty(3)
+
     def set_arm_command(self):
         if self.data_manager.status in (MotionStatus.PRE_REACH, MotionStatus.REACH):
-            target_pos = self.env.unwrapped.get_body_pose("cable_end")[0:3]
+            target_pos = self._target_pos
+            np.copyto(target_pos, self._cable_end_body.xpos)
             if self.data_manager.status == MotionStatus.PRE_REACH:
                 target_pos[2] = 1.02  # [m]
             elif self.data_manager.status == MotionStatus.REACH:
                 target_pos[2] = 0.995  # [m]
-            self.motion_manager.target_se3 = pin.SE3(
-                np.diag([-1.0, 1.0, -1.0]), target_pos
-            )
+            self.motion_manager.target_se3 = pin.SE3(GRASP_ROT, target_pos)
         else:
             super().set_arm_command()
 
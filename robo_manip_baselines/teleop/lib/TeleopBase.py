@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 import argparse
+import concurrent.futures
+import threading
 import time
 import datetime
 import numpy as np
@@ -46,8 +48,22 @@ class TeleopBase(metaclass=ABCMeta):
             default=None,
             help="log file path when replay log motion",
         )
+        parser.add_argument(
+            "--vis_fps",
+            type=float,
+            default=15.0,
+            help="upper limit of the visualization frame rate",
+        )
         self.args = parser.parse_args()
 
+        # Bind the options read in the control loop to attributes to avoid
+        # repeated Namespace lookups per tick
+        self._replay_log = self.args.replay_log
+        self._is_replay = self._replay_log is not None
+        self._world_idx_list = self.args.world_idx_list
+        self._enable_3d_plot = self.args.enable_3d_plot
+        self._replay_statuses = frozenset((MotionStatus.TELEOP, MotionStatus.END))
+
         # Setup gym environment
         self.setup_env()
         self.env.reset(seed=42)
@@ -63,7 +79,7 @@ class TeleopBase(metaclass=ABCMeta):
         self.datetime_now = datetime.datetime.now()
 
         # Setup 3D plot
-        if self.args.enable_3d_plot:
+        if self._enable_3d_plot:
             plt.rcParams["keymap.quit"] = ["q", "escape"]
             self.fig, self.ax = plt.subplots(
                 len(self.env.unwrapped.camera_names),
@@ -75,8 +91,34 @@ class TeleopBase(metaclass=ABCMeta):
                 self.env.unwrapped.camera_names
             )
 
+        # Window canvas (allocated on the first drawImage call)
+        self._window_canvas = None
+        self._window_tile_list = None
+        self._window_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.env.unwrapped.camera_names)
+        )
+        # The camera tiles are drawn in parallel threads above OpenCV, so disable
+        # the OpenCV internal threading to avoid oversubscription
+        cv2.setNumThreads(1)
+
+        # Data keys derived from the camera names are fixed, so build them once
+        self.rgb_image_key_dict = {
+            camera_name: DataKey.get_rgb_image_key(camera_name)
+            for camera_name in self.env.unwrapped.camera_names
+        }
+        self.depth_image_key_dict = {
+            camera_name: DataKey.get_depth_image_key(camera_name)
+            for camera_name in self.env.unwrapped.camera_names
+        }
+
+        # Visualization runs at its own cadence, decoupled from the control loop
+        self._vis_interval = 1.0 / self.args.vis_fps
+        self._last_vis_time = 0.0
+
         # Command configuration
         self._spacemouse_connected = False
+        self._spacemouse_state_lock = threading.Lock()
+        self._latest_spacemouse_state = None
         self.command_pos_scale = 1e-2
         self.command_rpy_scale = 5e-3
         self.gripper_scale = 5.0
@@ -84,25 +126,30 @@ class TeleopBase(metaclass=ABCMeta):
     def run(self):
         self.reset_flag = True
         self.quit_flag = False
-        iteration_duration_list = []
+        # Preallocated buffer for the TELEOP iteration durations, grown by
+        # doubling, so that long sessions do not accumulate boxed floats
+        iteration_duration_buf = np.empty(8192)
+        iteration_duration_len = 0
+        dt = self.env.unwrapped.dt
+        next_deadline = time.perf_counter() + dt
 
         while True:
-            iteration_start_time = time.time()
+            iteration_start_time = time.perf_counter()
 
             # Reset
             if self.reset_flag:
                 self.motion_manager.reset()
-                if self.args.replay_log is None:
+                if not self._is_replay:
                     self.data_manager.reset()
-                    if self.args.world_idx_list is None:
+                    if self._world_idx_list is None:
                         world_idx = None
                     else:
-                        world_idx = self.args.world_idx_list[
-                            self.data_manager.data_idx % len(self.args.world_idx_list)
+                        world_idx = self._world_idx_list[
+                            self.data_manager.data_idx % len(self._world_idx_list)
                         ]
                 else:
-                    self.data_manager.load_data(self.args.replay_log)
-                    print("- Load teleoperation data: {}".format(self.args.replay_log))
+                    self.data_manager.load_data(self._replay_log)
+                    print("- Load teleoperation data: {}".format(self._replay_log))
                     world_idx = self.data_manager.get_data("world_idx").tolist()
                 self.data_manager.setup_sim_world(world_idx)
                 obs, info = self.env.reset()
@@ -118,15 +165,13 @@ class TeleopBase(metaclass=ABCMeta):
 
             # Read spacemouse
             if self.data_manager.status == MotionStatus.TELEOP:
-                # Empirically, you can call read repeatedly to get the latest device status
-                for i in range(10):
-                    self.spacemouse_state = pyspacemouse.read()
+                # A background thread continuously drains the device, so just
+                # take the latest state here
+                with self._spacemouse_state_lock:
+                    self.spacemouse_state = self._latest_spacemouse_state
 
             # Get action
-            if self.args.replay_log is not None and self.data_manager.status in (
-                MotionStatus.TELEOP,
-                MotionStatus.END,
-            ):
+            if self._is_replay and (self.data_manager.status in self._replay_statuses):
                 action = self.data_manager.get_single_data(
                     DataKey.COMMAND_JOINT_POS, self.teleop_time_idx
                 )
@@ -142,9 +187,8 @@ class TeleopBase(metaclass=ABCMeta):
                 action = self.motion_manager.get_action()
 
             # Record data
-            if (
-                self.data_manager.status == MotionStatus.TELEOP
-                and self.args.replay_log is None
+            if self.data_manager.status == MotionStatus.TELEOP and (
+                not self._is_replay
             ):
                 self.data_manager.append_single_data(
                     DataKey.TIME, self.data_manager.status_elapsed_duration
@@ -167,41 +211,52 @@ class TeleopBase(metaclass=ABCMeta):
                 )
                 for camera_name in self.env.unwrapped.camera_names:
                     self.data_manager.append_single_data(
-                        DataKey.get_rgb_image_key(camera_name),
+                        self.rgb_image_key_dict[camera_name],
                         info["rgb_images"][camera_name],
                     )
                     self.data_manager.append_single_data(
-                        DataKey.get_depth_image_key(camera_name),
-                        info["depth_images"][camera_name],
+                        self.depth_image_key_dict[camera_name],
+                        # Half precision halves the depth memory and save
+                        # bandwidth and is ample for camera depth noise levels
+                        info["depth_images"][camera_name].astype(np.float16),
                     )
 
             # Step environment
             obs, _, _, _, info = self.env.step(action)
 
-            # Draw images
-            self.drawImage(info)
-
-            # Draw point clouds
-            if self.args.enable_3d_plot:
-                self.drawPointCloud(info)
+            # Draw images and point clouds at the visualization cadence
+            vis_time = time.perf_counter()
+            if vis_time - self._last_vis_time >= self._vis_interval:
+                self.drawImage(info)
+                if self._enable_3d_plot:
+                    self.drawPointCloud(info)
+                self._last_vis_time = vis_time
 
             # Manage status
             self.manage_status()
             if self.quit_flag:
                 break
 
-            iteration_duration = time.time() - iteration_start_time
+            now = time.perf_counter()
+            iteration_duration = now - iteration_start_time
             if self.data_manager.status == MotionStatus.TELEOP:
-                iteration_duration_list.append(iteration_duration)
-            if iteration_duration < self.env.unwrapped.dt:
-                time.sleep(self.env.unwrapped.dt - iteration_duration)
+                if iteration_duration_len == iteration_duration_buf.shape[0]:
+                    iteration_duration_buf = np.resize(
+                        iteration_duration_buf, 2 * iteration_duration_buf.shape[0]
+                    )
+                iteration_duration_buf[iteration_duration_len] = iteration_duration
+                iteration_duration_len += 1
+            # Pace the loop against a monotonic deadline so that sleep jitter
+            # does not accumulate as drift; re-anchor after an overrun instead
+            # of busy catching up
+            next_deadline = max(next_deadline + dt, now)
+            if next_deadline > now:
+                time.sleep(next_deadline - now)
 
         print("- Statistics on teleoperation")
-        if len(iteration_duration_list) > 0:
-            iteration_duration_list = np.array(iteration_duration_list)
-            print(
-                f"  - Real-time factor | {self.env.unwrapped.dt / iteration_duration_list.mean():.2f}"
-            )
+        if iteration_duration_len > 0:
+            iteration_duration_list = iteration_duration_buf[:iteration_duration_len]
+            print(f"  - Real-time factor | {dt / iteration_duration_list.mean():.2f}")
             print(
                 "  - Iteration duration [s] | "
                 f"mean: {iteration_duration_list.mean():.3f}, std: {iteration_duration_list.std():.3f} "
@@ -238,45 +293,97 @@ class TeleopBase(metaclass=ABCMeta):
                 self.env.unwrapped.gripper_action_idx
             ]
         elif self.data_manager.status == MotionStatus.TELEOP:
-            if (
-                self.spacemouse_state.buttons[0] > 0
-                and self.spacemouse_state.buttons[-1] <= 0
-            ):
-                self.motion_manager.gripper_pos += self.gripper_scale
-            elif (
-                self.spacemouse_state.buttons[-1] > 0
-                and self.spacemouse_state.buttons[0] <= 0
-            ):
-                self.motion_manager.gripper_pos -= self.gripper_scale
+            # Branchless variant of "open if only the first button is pressed,
+            # close if only the last button is pressed": the difference is zero
+            # when both or neither are pressed
+            self.motion_manager.gripper_pos += self.gripper_scale * (
+                int(self.spacemouse_state.buttons[0] > 0)
+                - int(self.spacemouse_state.buttons[-1] > 0)
+            )
 
     def drawImage(self, info):
         status_image = self.data_manager.get_status_image()
-        rgb_images = []
-        depth_images = []
-        for camera_name in self.env.unwrapped.camera_names:
-            rgb_image = info["rgb_images"][camera_name]
-            image_ratio = rgb_image.shape[1] / rgb_image.shape[0]
-            resized_image_width = status_image.shape[1] / 2
-            resized_image_size = (
-                int(resized_image_width),
-                int(resized_image_width / image_ratio),
+
+        # Allocate the window canvas once and compute the tile layout, so that
+        # each frame is resized directly into its canvas slice without the
+        # per-frame vconcat/hconcat temporaries
+        if self._window_canvas is None:
+            resized_image_width = status_image.shape[1] // 2
+            self._window_tile_list = []
+            tile_y = 0
+            for camera_name in self.env.unwrapped.camera_names:
+                rgb_image = info["rgb_images"][camera_name]
+                image_ratio = rgb_image.shape[1] / rgb_image.shape[0]
+                resized_image_size = (
+                    resized_image_width,
+                    int(resized_image_width / image_ratio),
+                )
+                depth_color_image = np.empty(
+                    info["depth_images"][camera_name].shape + (3,), dtype=np.uint8
+                )
+                rgb_tile_image = np.empty(
+                    (resized_image_size[1], resized_image_size[0], 3), dtype=np.uint8
+                )
+                self._window_tile_list.append(
+                    (tile_y, resized_image_size, depth_color_image, rgb_tile_image)
+                )
+                tile_y += resized_image_size[1]
+            # The canvas is composed directly in BGR for cv2.imshow
+            self._window_canvas = np.empty(
+                (tile_y + status_image.shape[0], status_image.shape[1], 3),
+                dtype=np.uint8,
+            )
+
+        window_image = self._window_canvas
+        resized_image_width = status_image.shape[1] // 2
+
+        def draw_single_tile(tile_args):
+            (
+                camera_name,
+                (tile_y, resized_image_size, depth_color_image, rgb_tile_image),
+            ) = tile_args
+            cv2.resize(
+                info["rgb_images"][camera_name],
+                resized_image_size,
+                dst=rgb_tile_image,
+                interpolation=cv2.INTER_AREA,
+            )
+            # Swap to BGR on the small resized tile; the depth tile replicates a
+            # gray channel, so it needs no conversion
+            cv2.cvtColor(
+                rgb_tile_image,
+                cv2.COLOR_RGB2BGR,
+                dst=window_image[
+                    tile_y : tile_y + resized_image_size[1], :resized_image_width
+                ],
             )
-            rgb_images.append(cv2.resize(rgb_image, resized_image_size))
             depth_image = convertDepthImageToColorImage(
-                info["depth_images"][camera_name]
+                info["depth_images"][camera_name], dst=depth_color_image
             )
-            depth_images.append(cv2.resize(depth_image, resized_image_size))
-        window_image = cv2.vconcat(
-            (
-                cv2.hconcat((cv2.vconcat(rgb_images), cv2.vconcat(depth_images))),
-                status_image,
+            cv2.resize(
+                depth_image,
+                resized_image_size,
+                dst=window_image[
+                    tile_y : tile_y + resized_image_size[1], resized_image_width:
+                ],
+                interpolation=cv2.INTER_AREA,
+            )
+
+        # cv2.resize releases the GIL and the camera tiles are independent, so
+        # they can be drawn in parallel threads
+        list(
+            self._window_executor.map(
+                draw_single_tile,
+                zip(self.env.unwrapped.camera_names, self._window_tile_list),
             )
         )
+        # The status image colors are defined in RGB
+        window_image[-status_image.shape[0] :] = status_image[..., ::-1]
         cv2.namedWindow(
             "image",
             flags=(cv2.WINDOW_AUTOSIZE | cv2.WINDOW_KEEPRATIO | cv2.WINDOW_GUI_NORMAL),
         )
-        cv2.imshow("image", cv2.cvtColor(window_image, cv2.COLOR_RGB2BGR))
+        cv2.imshow("image", window_image)
 
     def drawPointCloud(self, info):
         dist_thre_list = (3.0, 3.0, 0.8)  # [m]
@@ -289,7 +396,7 @@ class TeleopBase(metaclass=ABCMeta):
                 ::point_cloud_skip, ::point_cloud_skip
             ]
             fovy = self.data_manager.camera_info[
-                DataKey.get_depth_image_key(camera_name) + "_fovy"
+                self.depth_image_key_dict[camera_name] + "_fovy"
             ]
             xyz_array, rgb_array = convertDepthImageToPointCloud(
                 small_depth_image,
@@ -325,6 +432,20 @@ class TeleopBase(metaclass=ABCMeta):
         plt.draw()
         plt.pause(0.001)
 
+    def _read_spacemouse_loop(self):
+        """Continuously read the spacemouse state in a background thread.
+
+        Reading in a dedicated thread keeps the device drained and removes the
+        HID reads from the realtime loop, which only copies the latest state.
+        """
+        while True:
+            state = pyspacemouse.read()
+            with self._spacemouse_state_lock:
+                self._latest_spacemouse_state = state
+            # The device is opened in non-blocking mode, so yield briefly to
+            # avoid busy-spinning against the control loop
+            time.sleep(0.001)
+
     def manage_status(self):
         key = cv2.waitKey(1)
         if self.data_manager.status == MotionStatus.INITIAL:
@@ -344,18 +465,22 @@ class TeleopBase(metaclass=ABCMeta):
         elif self.data_manager.status == MotionStatus.GRASP:
             if key == ord("n"):
                 # Setup spacemouse
-                if (self.args.replay_log is None) and (not self._spacemouse_connected):
+                if (not self._is_replay) and (not self._spacemouse_connected):
                     self._spacemouse_connected = True
                     pyspacemouse.open()
+                    self._latest_spacemouse_state = pyspacemouse.read()
+                    threading.Thread(
+                        target=self._read_spacemouse_loop, daemon=True
+                    ).start()
                 self.teleop_time_idx = 0
-                if self.args.replay_log is None:
+                if not self._is_replay:
                     print("- Press the 'n' key to finish teleoperation.")
                 else:
                     print("- Start to replay the log motion.")
                 self.data_manager.go_to_next_status()
         elif self.data_manager.status == MotionStatus.TELEOP:
             self.teleop_time_idx += 1
-            if self.args.replay_log is None:
+            if not self._is_replay:
                 if key == ord("n"):
                     print(
                         "- Press the 's' key if the teleoperation succeeded,"
@@ -372,7 +497,7 @@ class TeleopBase(metaclass=ABCMeta):
                     )
                     self.data_manager.go_to_next_status()
         elif self.data_manager.status == MotionStatus.END:
-            if self.args.replay_log is None:
+            if not self._is_replay:
                 if key == ord("s"):
                     # Save data
                     self.save_data()
@@ -401,13 +526,13 @@ class TeleopBase(metaclass=ABCMeta):
             print("- Compress rgb images")
             for camera_name in self.env.unwrapped.camera_names:
                 self.data_manager.compress_data(
-                    DataKey.get_rgb_image_key(camera_name), "jpg"
+                    self.rgb_image_key_dict[camera_name], "jpg"
                 )
         if self.args.compress_depth:
             print("- Compress depth images")
             for camera_name in self.env.unwrapped.camera_names:
                 self.data_manager.compress_data(
-                    DataKey.get_depth_image_key(camera_name), "exr"
+                    self.depth_image_key_dict[camera_name], "exr"
                 )
         self.data_manager.save_data(filename)
         print("- Teleoperation succeeded: Save the data as {}".format(filename))
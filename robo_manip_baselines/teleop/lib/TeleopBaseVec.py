@@ -1,6 +1,5 @@
 import time
 import numpy as np
-import pyspacemouse
 from robo_manip_baselines.common import MotionStatus, DataKey, DataManagerVec
 from .TeleopBase import TeleopBase
 
@@ -14,55 +13,71 @@ class TeleopBaseVec(TeleopBase):
     def run(self):
         self.reset_flag = True
         self.quit_flag = False
-        iteration_duration_list = []
+        # Preallocated buffer for the TELEOP iteration durations, grown by
+        # doubling, so that long sessions do not accumulate boxed floats
+        iteration_duration_buf = np.empty(8192)
+        iteration_duration_len = 0
+
+        # Bind loop-invariant attributes to locals to avoid repeated attribute
+        # lookups in the hot loop
+        env_unwrapped = self.env.unwrapped
+        data_manager = self.data_manager
+        motion_manager = self.motion_manager
+        num_envs = env_unwrapped.num_envs
+        rep_env_idx = env_unwrapped.rep_env_idx
+        camera_names = env_unwrapped.camera_names
+        dt = env_unwrapped.dt
+        next_deadline = time.perf_counter() + dt
 
         while True:
-            iteration_start_time = time.time()
+            iteration_start_time = time.perf_counter()
 
             # Reset
             if self.reset_flag:
-                self.motion_manager.reset()
-                if self.args.replay_log is None:
-                    self.data_manager.reset()
-                    if self.args.world_idx_list is None:
+                motion_manager.reset()
+                if not self._is_replay:
+                    data_manager.reset()
+                    if self._world_idx_list is None:
                         world_idx = None
                     else:
-                        world_idx = self.args.world_idx_list[
-                            self.data_manager.data_idx % len(self.args.world_idx_list)
+                        world_idx = self._world_idx_list[
+                            data_manager.data_idx % len(self._world_idx_list)
                         ]
                 else:
                     raise NotImplementedError(
                         '[TeleopBaseVec] The "replay_log" option is not supported.'
                     )
-                    self.data_manager.load_data(self.args.replay_log)
-                    print("- Load teleoperation data: {}".format(self.args.replay_log))
-                    world_idx = self.data_manager.get_data("world_idx").tolist()
-                self.data_manager.setup_sim_world(world_idx)
+                    data_manager.load_data(self._replay_log)
+                    print("- Load teleoperation data: {}".format(self._replay_log))
+                    world_idx = data_manager.get_data("world_idx").tolist()
+                data_manager.setup_sim_world(world_idx)
                 self.env.reset()
-                obs_list = self.env.unwrapped.obs_list
-                info_list = self.env.unwrapped.info_list
+                obs_list = env_unwrapped.obs_list
+                info_list = env_unwrapped.info_list
                 print(
                     "[{}] data_idx: {}, world_idx: {}".format(
                         self.demo_name,
-                        self.data_manager.data_idx,
-                        self.data_manager.world_idx,
+                        data_manager.data_idx,
+                        data_manager.world_idx,
                     )
                 )
                 print("- Press the 'n' key to start automatic grasping.")
                 self.reset_flag = False
 
+            # The status is only updated on reset and in manage_status, so a single
+            # read per iteration is sufficient up to the manage_status call below
+            status = data_manager.status
+
             # Read spacemouse
-            if self.data_manager.status == MotionStatus.TELEOP:
-                # Empirically, you can call read repeatedly to get the latest device status
-                for i in range(10):
-                    self.spacemouse_state = pyspacemouse.read()
+            if status == MotionStatus.TELEOP:
+                # A background thread continuously drains the device, so just
+                # take the latest state here
+                with self._spacemouse_state_lock:
+                    self.spacemouse_state = self._latest_spacemouse_state
 
             # Get action
-            if self.args.replay_log is not None and self.data_manager.status in (
-                MotionStatus.TELEOP,
-                MotionStatus.END,
-            ):
-                action = self.data_manager.get_single_data(
+            if self._is_replay and (status in self._replay_statuses):
+                action = data_manager.get_single_data(
                     DataKey.COMMAND_JOINT_POS, self.teleop_time_idx
                 )
             else:
@@ -71,90 +86,100 @@ class TeleopBaseVec(TeleopBase):
                 self.set_gripper_command()
 
                 # Solve IK
-                self.motion_manager.draw_markers()
-                self.motion_manager.inverse_kinematics()
+                motion_manager.draw_markers()
+                motion_manager.inverse_kinematics()
 
-                action = self.motion_manager.get_action()
-                update_fluctuation = self.data_manager.status == MotionStatus.TELEOP
-                action_list = self.env.unwrapped.get_fluctuated_action_list(
+                action = motion_manager.get_action()
+                update_fluctuation = status == MotionStatus.TELEOP
+                action_list = env_unwrapped.get_fluctuated_action_list(
                     action, update_fluctuation
                 )
 
             # Record data
-            if (
-                self.data_manager.status == MotionStatus.TELEOP
-                and self.args.replay_log is None
-            ):
-                self.data_manager.append_single_data(
+            if status == MotionStatus.TELEOP and not self._is_replay:
+                data_manager.append_single_data(
                     DataKey.TIME,
-                    [self.data_manager.status_elapsed_duration]
-                    * self.env.unwrapped.num_envs,
+                    [data_manager.status_elapsed_duration] * num_envs,
                 )
-                self.data_manager.append_single_data(
+                data_manager.append_single_data(
                     DataKey.MEASURED_JOINT_POS,
-                    [self.motion_manager.get_joint_pos(obs) for obs in obs_list],
-                )
-                self.data_manager.append_single_data(
-                    DataKey.COMMAND_JOINT_POS, action_list
+                    motion_manager.get_joint_pos_list(obs_list),
                 )
-                self.data_manager.append_single_data(
+                data_manager.append_single_data(DataKey.COMMAND_JOINT_POS, action_list)
+                data_manager.append_single_data(
                     DataKey.MEASURED_JOINT_VEL,
-                    [self.motion_manager.get_joint_vel(obs) for obs in obs_list],
+                    motion_manager.get_joint_vel_list(obs_list),
                 )
-                self.data_manager.append_single_data(
+                data_manager.append_single_data(
                     DataKey.MEASURED_EEF_POSE,
-                    [self.motion_manager.get_measured_eef(obs) for obs in obs_list],
+                    motion_manager.get_measured_eef_seq(obs_list),
                 )
                 # TODO: COMMAND_EEF_POSE does not reflect the effect of action fluctuation
-                self.data_manager.append_single_data(
+                command_eef = motion_manager.get_command_eef()
+                data_manager.append_single_data(
                     DataKey.COMMAND_EEF_POSE,
-                    [self.motion_manager.get_command_eef()]
-                    * self.env.unwrapped.num_envs,
+                    # Zero-copy replication; the data manager copies the rows
+                    # into its preallocated buffer
+                    np.broadcast_to(command_eef, (num_envs, command_eef.shape[0])),
                 )
-                self.data_manager.append_single_data(
+                data_manager.append_single_data(
                     DataKey.MEASURED_EEF_WRENCH,
-                    [self.motion_manager.get_eef_wrench(obs) for obs in obs_list],
+                    motion_manager.get_eef_wrench_list(obs_list),
                 )
-                for camera_name in self.env.unwrapped.camera_names:
-                    self.data_manager.append_single_data(
-                        DataKey.get_rgb_image_key(camera_name),
+                for camera_name in camera_names:
+                    data_manager.append_single_data(
+                        self.rgb_image_key_dict[camera_name],
                         [info["rgb_images"][camera_name] for info in info_list],
                     )
-                    self.data_manager.append_single_data(
-                        DataKey.get_depth_image_key(camera_name),
-                        [info["depth_images"][camera_name] for info in info_list],
+                    data_manager.append_single_data(
+                        self.depth_image_key_dict[camera_name],
+                        # Half precision halves the depth memory and save
+                        # bandwidth and is ample for camera depth noise levels
+                        [
+                            info["depth_images"][camera_name].astype(np.float16)
+                            for info in info_list
+                        ],
                     )
 
             # Step environment
-            self.env.unwrapped.action_list = action_list
+            env_unwrapped.action_list = action_list
             self.env.step(action)
-            obs_list = self.env.unwrapped.obs_list
-            info_list = self.env.unwrapped.info_list
-
-            # Draw images
-            self.drawImage(info_list[self.env.unwrapped.rep_env_idx])
+            obs_list = env_unwrapped.obs_list
+            info_list = env_unwrapped.info_list
 
-            # Draw point clouds
-            if self.args.enable_3d_plot:
-                self.drawPointCloud(info_list[[self.env.unwrapped.rep_env_idx]])
+            # Draw images and point clouds at the visualization cadence
+            vis_time = time.perf_counter()
+            if vis_time - self._last_vis_time >= self._vis_interval:
+                self.drawImage(info_list[rep_env_idx])
+                if self._enable_3d_plot:
+                    self.drawPointCloud(info_list[[rep_env_idx]])
+                self._last_vis_time = vis_time
 
             # Manage status
             self.manage_status()
             if self.quit_flag:
                 break
 
-            iteration_duration = time.time() - iteration_start_time
-            if self.data_manager.status == MotionStatus.TELEOP:
-                iteration_duration_list.append(iteration_duration)
-            if iteration_duration < self.env.unwrapped.dt:
-                time.sleep(self.env.unwrapped.dt - iteration_duration)
+            now = time.perf_counter()
+            iteration_duration = now - iteration_start_time
+            if data_manager.status == MotionStatus.TELEOP:
+                if iteration_duration_len == iteration_duration_buf.shape[0]:
+                    iteration_duration_buf = np.resize(
+                        iteration_duration_buf, 2 * iteration_duration_buf.shape[0]
+                    )
+                iteration_duration_buf[iteration_duration_len] = iteration_duration
+                iteration_duration_len += 1
+            # Pace the loop against a monotonic deadline so that sleep jitter
+            # does not accumulate as drift; re-anchor after an overrun instead
+            # of busy catching up
+            next_deadline = max(next_deadline + dt, now)
+            if next_deadline > now:
+                time.sleep(next_deadline - now)
 
         print("- Statistics on teleoperation")
-        if len(iteration_duration_list) > 0:
-            iteration_duration_list = np.array(iteration_duration_list)
-            print(
-                f"  - Real-time factor | {self.env.unwrapped.dt / iteration_duration_list.mean():.2f}"
-            )
+        if iteration_duration_len > 0:
+            iteration_duration_list = iteration_duration_buf[:iteration_duration_len]
+            print(f"  - Real-time factor | {dt / iteration_duration_list.mean():.2f}")
             print(
                 "  - Iteration duration [s] | "
                 f"mean: {iteration_duration_list.mean():.3f}, std: {iteration_duration_list.std():.3f} "
@@ -189,7 +214,7 @@ class TeleopBaseVec(TeleopBase):
             print("- Compress rgb images")
             for camera_name in self.env.unwrapped.camera_names:
                 self.data_manager.compress_data(
-                    DataKey.get_rgb_image_key(camera_name),
+                    self.rgb_image_key_dict[camera_name],
                     "jpg",
                     filter_list=list(map(bool, filename_list)),
                 )
@@ -197,7 +222,7 @@ class TeleopBaseVec(TeleopBase):
             print("- Compress depth images")
             for camera_name in self.env.unwrapped.camera_names:
                 self.data_manager.compress_data(
-                    DataKey.get_depth_image_key(camera_name),
+                    self.depth_image_key_dict[camera_name],
                     "exr",
                     filter_list=list(map(bool, filename_list)),
                 )
@@ -59,7 +59,12 @@ for idx, (_actions, _joints, _images) in enumerate(tqdm(data)):
         ep_ends[idx] = ep_ends[idx - 1] + len(_joints)
 
 # https://github.com/real-stanford/diffusion_policy/blob/548a52bbb105518058e27bf34dcf90bf6f73681a/diffusion_policy/config/task/real_pusht_image.yaml#L3
-images = np.array([cv2.resize(image, (320, 240)) for image in images])
+# All frames share the same size, so resize directly into slices of a single
+# preallocated output array instead of stacking a list of per-frame results
+resized_images = np.empty((len(images), 240, 320, 3), dtype=images.dtype)
+for time_idx, image in enumerate(images):
+    cv2.resize(image, (320, 240), dst=resized_images[time_idx])
+images = resized_images
 
 print(f"[convert_npz_to_zarr] Save a zarr file: {args.out_dir}")
 zarr_root = zarr.open(args.out_dir, mode="w")